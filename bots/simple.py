@@ -1,40 +1,275 @@
 from __future__ import annotations
+import os
+import random
 import typing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 if typing.TYPE_CHECKING:
     from game import BlockBlast
 
+try:
+    import game_core
+except ImportError:
+    # extension not built, the pure python search is used instead
+    game_core = None
+
+try:
+    import game_numba
+except ImportError:
+    # numba or numpy missing
+    game_numba = None
+
+
+MAX_DEAD_STATES = 200_000
+HASH_MASK = (1 << 64) - 1
+
+# per worker process solver, set up once by _init_worker
+_worker_solver = None
+
+
+def _init_worker(board_size: tuple[int, int]):
+    global _worker_solver
+    from game import BlockBlast
+    _worker_solver = Solver(BlockBlast(board_size))
+
+
+def _solve_from(board: int, pieces: tuple[str, ...], first_move: tuple[str, tuple[int, int]]) -> list | None:
+    """Searches the subtree below one root move inside a worker process."""
+    game = _worker_solver.game
+    game.board = board
+    game.current_pieces = list(pieces)
+    solution = _worker_solver.get_solution()
+    if solution is None:
+        return None
+    return [first_move] + solution
+
 
 class Solver:
-    def __init__(self, game:BlockBlast):
+    def __init__(self, game:BlockBlast, processes: int = 1):
+        """
+        processes > 1 splits every search across a process pool by its first move,
+        which only pays off when single searches are slow (pure python, large boards).
+        """
         self.game = game
         self.solution = []
+        self.processes = min(processes, os.cpu_count() or 1)
+        self._pool = None
+
+        # zobrist keys; a private rng so the game's seeded piece stream is untouched
+        rng = random.Random(0)
+        self.zob_cell = [rng.getrandbits(64) for _ in range(game.width * game.height)]
+        self.zob_piece = [rng.getrandbits(64) for _ in game.all_piece_names]
+        # hashes of (board, remaining pieces) states known to have no solution, oldest first
+        self.dead_states = {}
+
+        self._native_tables = None
+        self._jit_tables = None
+        # legal origins of piece q on a board holding only piece p at pos, keyed by (p, pos, q)
+        self._fits_beside = {}
+
+    def _board_hash(self, board: int) -> int:
+        zob_cell = self.zob_cell
+        h = 0
+        while board:
+            lsb = board & -board
+            h ^= zob_cell[lsb.bit_length() - 1]
+            board ^= lsb
+        return h
+
+    def _get_native_solution(self) -> list:
+        game = self.game
+        if self._native_tables is None:
+            self._native_tables = (game.width, game.height, game.piece_mask_at_or_zero, game.row_masks, game.col_masks)
+        game_core.load(*self._native_tables)
+
+        solution = game_core.solve(game.board, tuple(game.piece_ids[p] for p in game.current_pieces))
+        if solution is None:
+            return None
+        return [(game.all_piece_names[p], (pos % game.width, pos // game.width)) for p, pos in solution]
+
+    def _get_jit_solution(self) -> list:
+        game = self.game
+        if self._jit_tables is None:
+            self._jit_tables = game_numba.build_tables(game)
+
+        solution = game_numba.solve(game.board, [game.piece_ids[p] for p in game.current_pieces], self._jit_tables)
+        if solution is None:
+            return None
+        return [(game.all_piece_names[p], (pos % game.width, pos // game.width)) for p, pos in solution]
+
+    def _get_parallel_solution(self) -> list:
+        game = self.game
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.processes, initializer=_init_worker, initargs=((game.width, game.height),)
+            )
+
+        pieces = game.current_pieces
+        board = game.board
+        W = game.width
+        futures = []
+        for i, p in enumerate(pieces):
+            rest = tuple(pieces[:i] + pieces[i + 1:])
+            piece_id = game.piece_ids[p]
+            masks = game.piece_mask_at[piece_id]
+            origins = game._legal_origins(board, piece_id)
+            while origins:
+                lsb = origins & -origins
+                pos = lsb.bit_length() - 1
+                origins ^= lsb
+                # placed the way the serial search does, without try_move's game over check
+                next_board = game._clear_lines(board | masks[pos])[0]
+                futures.append(self._pool.submit(_solve_from, next_board, rest, (p, (pos % W, pos // W))))
 
-    def get_solution(self) -> list:
-        def recurse(board: int, pieces: list[str]):
-            if not pieces:
-                yield []
-                return
-            for i, p in enumerate(pieces):
-                for y in range(self.game.height):
-                    for x in range(self.game.width):
-                        if self.game.is_valid_move(board, p, (x, y)):
-                            next_board = self.game.try_move(board, p, (x, y))['board']
-                            next_pieces = pieces.copy()
-                            next_pieces.pop(i)
-
-                            for placable_move in recurse(next_board, next_pieces):
-                                next_sequence = [(p, (x, y))] + placable_move
-                                yield next_sequence
-
-        current_pieces = self.game.current_pieces.copy()
         try:
-            solution_sequence = next(recurse(self.game.board, current_pieces))
-            return solution_sequence
-        except StopIteration:
-            # no solution is found
+            for future in as_completed(futures):
+                solution = future.result()
+                if solution is not None:
+                    return solution
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self):
+        """Shuts down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def get_solution(self) -> list:
+        if self.processes > 1 and len(self.game.current_pieces) > 1:
+            return self._get_parallel_solution()
+
+        if self.game.width * self.game.height <= 64:
+            if game_core is not None:
+                return self._get_native_solution()
+            if game_numba is not None:
+                return self._get_jit_solution()
+
+        legal_origins = self.game._legal_origins
+        neighbor_mask_at = self.game.piece_neighbor_mask_at
+        piece_mask_at = self.game.piece_mask_at
+        clear_lines = self.game._clear_lines
+        W = self.game.width
+        zob_cell = self.zob_cell
+        zob_piece = self.zob_piece
+        dead = self.dead_states
+        fits_beside = self._fits_beside
+
+        piece_names = self.game.all_piece_names
+        pieces = tuple(self.game.piece_ids[name] for name in self.game.current_pieces)
+        n = len(pieces)
+        path = [None] * n
+        # big pieces first, they are the likeliest not to fit and fail fast
+        piece_order = sorted(range(n), key=lambda i: -self.game.piece_bit_count[pieces[i]])
+
+        # explicit DFS stack, one slot per depth: the state reached, its transposition key,
+        # the position in piece_order being tried and its not yet tried legal origins
+        boards = [0] * (n + 1)
+        board_hashes = [0] * (n + 1)
+        remaining_masks = [0] * (n + 1)
+        pieces_hashes = [0] * (n + 1)
+        keys = [0] * (n + 1)
+        slots = [-1] * (n + 1)
+        untried = [[] for _ in range(n + 1)]
+        # legal origins of every piece in hand, kept up to date incrementally as pieces are placed
+        legal = [[0] * n for _ in range(n + 1)]
+
+        boards[0] = self.game.board
+        board_hashes[0] = self._board_hash(self.game.board)
+        remaining_masks[0] = (1 << n) - 1
+        # summed rather than xored so repeated pieces do not cancel out
+        pieces_hashes[0] = sum(zob_piece[p] for p in pieces) & HASH_MASK
+        keys[0] = board_hashes[0] ^ pieces_hashes[0]
+        for j in range(n):
+            legal[0][j] = legal_origins(boards[0], pieces[j])
+        if n == 0:
+            return []
+        if keys[0] in dead:
             return None
 
+        depth = 0
+        while True:
+            if not untried[depth]:
+                # move on to the next piece still in hand at this depth
+                k = slots[depth] + 1
+                while k < n and not (remaining_masks[depth] >> piece_order[k]) & 1:
+                    k += 1
+                if k < n:
+                    slots[depth] = k
+                    board = boards[depth]
+                    p = pieces[piece_order[k]]
+                    origins = []
+                    origin_bits = legal[depth][piece_order[k]]
+                    while origin_bits:
+                        lsb = origin_bits & -origin_bits
+                        origins.append(lsb.bit_length() - 1)
+                        origin_bits ^= lsb
+                    # origins touching the most blocks leave the board least fragmented; they are
+                    # popped from the end, so sort ascending and break ties towards row-major order
+                    neighbors = neighbor_mask_at[p]
+                    origins.sort(key=lambda pos: ((neighbors[pos] & board).bit_count(), -pos))
+                    untried[depth] = origins
+                    continue
+
+                # every move from this state failed
+                dead[keys[depth]] = None
+                if len(dead) > MAX_DEAD_STATES:
+                    del dead[next(iter(dead))]
+                depth -= 1
+                if depth < 0:
+                    return None
+                continue
+
+            pos = untried[depth].pop()
+            i = piece_order[slots[depth]]
+            p = pieces[i]
+            board = boards[depth]
+            # origins come from the legal origin sweep, so place without revalidating
+            placed = piece_mask_at[p][pos]
+            next_board = clear_lines(board | placed)[0]
+            path[depth] = (piece_names[p], (pos % W, pos // W))
+            if depth + 1 == n:
+                return path.copy()
+
+            next_board_hash = board_hashes[depth]
+            changed = board ^ next_board
+            while changed:
+                lsb = changed & -changed
+                next_board_hash ^= zob_cell[lsb.bit_length() - 1]
+                changed ^= lsb
+            next_pieces_hash = (pieces_hashes[depth] - zob_piece[p]) & HASH_MASK
+            key = next_board_hash ^ next_pieces_hash
+            if key in dead:
+                continue
+
+            depth += 1
+            boards[depth] = next_board
+            board_hashes[depth] = next_board_hash
+            remaining_masks[depth] = remaining = remaining_masks[depth - 1] ^ (1 << i)
+            pieces_hashes[depth] = next_pieces_hash
+            keys[depth] = key
+            slots[depth] = -1
+            untried[depth] = []
+
+            # without a line clear cells were only added, so each piece just loses the origins
+            # that now overlap the placed piece; a clear frees cells and needs a full sweep
+            lines_cleared = next_board != board | placed
+            prev_legal, next_legal = legal[depth - 1], legal[depth]
+            for j in range(n):
+                if not (remaining >> j) & 1:
+                    continue
+                q = pieces[j]
+                if lines_cleared:
+                    next_legal[j] = legal_origins(next_board, q)
+                    continue
+                beside_key = (p, pos, q)
+                beside = fits_beside.get(beside_key)
+                if beside is None:
+                    beside = fits_beside[beside_key] = legal_origins(placed, q)
+                next_legal[j] = prev_legal[j] & beside
+
     def solve(self):
         if self.solution:
             next_move = self.solution.pop(0)
@@ -1,10 +1,255 @@
+import functools
 import random
+from collections import namedtuple
 from typing import Optional
 
+RENDER_CELLS = str.maketrans({'1': '■', '0': '.'})
+
+NAME_TO_PIECES = {
+    'sq1'       : 0b1,
+    'sq2'       : 0b11_11,
+    'sq3'       : 0b111_111_111,
+    'line2h'    : 0b11,
+    'line3h'    : 0b111,
+    'line4h'    : 0b1111,
+    'line5h'    : 0b11111,
+    'line2v'    : 0b1_1,
+    'line3v'    : 0b1_1_1,
+    'line4v'    : 0b1_1_1_1,
+    'line5v'    : 0b1_1_1_1_1,
+    'diag2'     : 0b01_10,
+    'diag3'     : 0b001_010_100,
+    'diag2f'    : 0b10_01,
+    'diag3f'    : 0b100_010_001,
+    'l1'        : 0b10_10_11,
+    'l2'        : 0b111_100,
+    'l3'        : 0b11_01_01,
+    'l4'        : 0b001_111,
+    'l1f'       : 0b01_01_11,
+    'l2f'       : 0b100_111,
+    'l3f'       : 0b11_10_10,
+    'l4f'       : 0b111_001,
+    't1'        : 0b010_111,
+    't2'        : 0b01_11_01,
+    't3'        : 0b111_010,
+    't4'        : 0b10_11_10,
+    's1'        : 0b011_110,
+    's2'        : 0b10_11_01,
+    's1f'       : 0b110_011,
+    's2f'       : 0b01_11_10,
+    'L1'        : 0b100_100_111,
+    'L2'        : 0b111_100_100,
+    'L3'        : 0b111_001_001,
+    'L4'        : 0b001_001_111,
+    'sL1'       : 0b10_11,
+    'sL2'       : 0b11_10,
+    'sL3'       : 0b11_01,
+    'sL4'       : 0b01_11
+}
+NAME_TO_SIZE = {
+    'sq1'       : (1, 1),
+    'sq2'       : (2, 2),
+    'sq3'       : (3, 3),
+    'line2h'    : (2, 1),
+    'line3h'    : (3, 1),
+    'line4h'    : (4, 1),
+    'line5h'    : (5, 1),
+    'line2v'    : (1, 2),
+    'line3v'    : (1, 3),
+    'line4v'    : (1, 4),
+    'line5v'    : (1, 5),
+    'diag2'     : (2, 2),
+    'diag3'     : (3, 3),
+    'diag2f'    : (2, 2),
+    'diag3f'    : (3, 3),
+    'l1'        : (2, 3),
+    'l2'        : (3, 2),
+    'l3'        : (2, 3),
+    'l4'        : (3, 2),
+    'l1f'       : (2, 3),
+    'l2f'       : (3, 2),
+    'l3f'       : (2, 3),
+    'l4f'       : (3, 2),
+    't1'        : (3, 2),
+    't2'        : (2, 3),
+    't3'        : (3, 2),
+    't4'        : (2, 3),
+    's1'        : (3, 2),
+    's2'        : (2, 3),
+    's1f'       : (3, 2),
+    's2f'       : (2, 3),
+    'L1'        : (3, 3),
+    'L2'        : (3, 3),
+    'L3'        : (3, 3),
+    'L4'        : (3, 3),
+    'sL1'       : (2, 2),
+    'sL2'       : (2, 2),
+    'sL3'       : (2, 2),
+    'sL4'       : (2, 2)
+}
+
+def _and_reduce_shifts(span: int, stride: int) -> list[int]:
+    """
+    Shift amounts that, applied as `x &= x >> shift`, leave bit i set only if the `span` bits
+    i, i + stride, ..., i + (span - 1) * stride were all set. Takes O(log span) steps.
+    The same schedule applied as `x |= x >> shift` sets bit i if any of them was set.
+    """
+    shifts = []
+    covered = 1
+    while covered * 2 <= span:
+        shifts.append(covered * stride)
+        covered *= 2
+    if covered < span:
+        shifts.append((span - covered) * stride)
+    return shifts
+
+BoardTables = namedtuple('BoardTables', [
+    'all_piece_names', 'piece_ids', 'piece_sizes', 'piece_masks', 'piece_cell_offsets', 'valid_origin_masks',
+    'piece_mask_at', 'in_bounds', 'piece_bit_count', 'piece_run_shifts', 'row_masks', 'col_masks',
+    'row_reduce_shifts', 'col_reduce_shifts', 'row_start_mask', 'col_start_mask', 'col_hit_shift',
+    'piece_neighbor_mask_at', 'piece_mask_at_or_zero',
+])
+
+@functools.lru_cache(maxsize=8)
+def _make_tables(width: int, height: int) -> BoardTables:
+    """
+    Builds every board-size dependent table once per size; instances share them, so they are tuples.
+    Per-piece tables are indexed by piece id, the piece's position in all_piece_names.
+    """
+    all_piece_names = tuple(NAME_TO_PIECES.keys())
+    piece_ids = {name: i for i, name in enumerate(all_piece_names)}
+    piece_sizes = [NAME_TO_SIZE[name] for name in all_piece_names]
+
+    piece_masks = []
+    piece_cell_offsets = []
+    valid_origin_masks = []
+    for name in all_piece_names:
+        compact_mask = NAME_TO_PIECES[name]
+        piece_w, piece_h = NAME_TO_SIZE[name]
+        scaled_mask = 0
+        for r in range(piece_h):
+            row_bits = (compact_mask >> (r * piece_w)) & ((1 << piece_w) - 1)
+            scaled_mask |= row_bits << (r * width)
+        piece_masks.append(scaled_mask)
+
+        # bit offsets (relative to the top-left origin) of every cell the piece covers
+        piece_cell_offsets.append(tuple(
+            r * width + c
+            for r in range(piece_h)
+            for c in range(piece_w)
+            if (compact_mask >> (r * piece_w + c)) & 1
+        ))
+
+        # origins where the piece's bounding box stays inside the board
+        origin_row = (1 << max(0, width - piece_w + 1)) - 1
+        valid_origin_mask = 0
+        for r in range(height - piece_h + 1):
+            valid_origin_mask |= origin_row << (r * width)
+        valid_origin_masks.append(valid_origin_mask)
+
+    # every piece mask pre-shifted to every origin, indexed by y * width + x
+    piece_mask_at = [
+        [mask << (y * width + x) for y in range(height) for x in range(width)]
+        for mask in piece_masks
+    ]
+
+    # whether the piece stays inside the board from each origin, indexed like piece_mask_at
+    in_bounds = [
+        [x + piece_w <= width and y + piece_h <= height for y in range(height) for x in range(width)]
+        for piece_w, piece_h in piece_sizes
+    ]
+
+    # piece_mask_at with 0 where the piece would leave the board, the form the native backends take:
+    # it fits 64 bit words on boards of at most 64 cells, and a mask is nonzero exactly when in bounds
+    piece_mask_at_or_zero = [
+        [mask if ok else 0 for mask, ok in zip(masks, bounds)]
+        for masks, bounds in zip(piece_mask_at, in_bounds)
+    ]
+
+    piece_bit_count = [NAME_TO_PIECES[name].bit_count() for name in all_piece_names]
+
+    # straight runs (sq1 and the lines) have their blocked origins OR-reduced in O(log length) shifts,
+    # None for every other shape
+    piece_run_shifts = []
+    for (piece_w, piece_h), bit_count in zip(piece_sizes, piece_bit_count):
+        if piece_h == 1 and bit_count == piece_w:
+            piece_run_shifts.append(_and_reduce_shifts(piece_w, 1))
+        elif piece_w == 1 and bit_count == piece_h:
+            piece_run_shifts.append(_and_reduce_shifts(piece_h, width))
+        else:
+            piece_run_shifts.append(None)
+
+    row_masks = [((1 << width) - 1) << (r * width) for r in range(height)]
+    col_masks = [0] * width
+    for c in range(width):
+        for r in range(height):
+            col_masks[c] |= 1 << (r * width + c)
+
+    # after AND-reducing the board, a full row leaves its first bit set and a full column its top bit
+    row_reduce_shifts = _and_reduce_shifts(width, 1)
+    col_reduce_shifts = _and_reduce_shifts(height, width)
+    row_start_mask = col_masks[0]
+    col_start_mask = row_masks[0]
+    col_hit_shift = width * height
+
+    # cells orthogonally touching each placed piece, 0 for origins that leave the board
+    board_mask = (1 << (width * height)) - 1
+    not_first_col = board_mask & ~col_masks[0]
+    not_last_col = board_mask & ~col_masks[-1]
+    piece_neighbor_mask_at = []
+    for p, masks in enumerate(piece_mask_at):
+        neighbor_masks = []
+        for pos, m in enumerate(masks):
+            if not in_bounds[p][pos]:
+                neighbor_masks.append(0)
+                continue
+            around = ((m & not_first_col) >> 1) | ((m & not_last_col) << 1) | (m >> width) | (m << width)
+            neighbor_masks.append(around & board_mask & ~m)
+        piece_neighbor_mask_at.append(neighbor_masks)
+
+    return BoardTables(
+        all_piece_names=all_piece_names,
+        piece_ids=piece_ids,
+        piece_sizes=tuple(piece_sizes),
+        piece_masks=tuple(piece_masks),
+        piece_cell_offsets=tuple(piece_cell_offsets),
+        valid_origin_masks=tuple(valid_origin_masks),
+        piece_mask_at=tuple(map(tuple, piece_mask_at)),
+        in_bounds=tuple(map(tuple, in_bounds)),
+        piece_bit_count=tuple(piece_bit_count),
+        piece_run_shifts=tuple(None if shifts is None else tuple(shifts) for shifts in piece_run_shifts),
+        row_masks=tuple(row_masks),
+        col_masks=tuple(col_masks),
+        row_reduce_shifts=tuple(row_reduce_shifts),
+        col_reduce_shifts=tuple(col_reduce_shifts),
+        row_start_mask=row_start_mask,
+        col_start_mask=col_start_mask,
+        col_hit_shift=col_hit_shift,
+        piece_neighbor_mask_at=tuple(map(tuple, piece_neighbor_mask_at)),
+        piece_mask_at_or_zero=tuple(map(tuple, piece_mask_at_or_zero)),
+    )
+
+
 class BlockBlast:
     """
     An efficient, bitboard-based implementation of the Block Blast game.
     """
+    # scoring constants, shared by every game and readable without creating one
+    SCORE_MULTIPLIERS = {1: 1.0, 2: 2.0, 3: 6.0, 4: 12.0, 5: 20.0, 6: 30.0}
+    BASE_SCORE_ACCELERATION = 34.2
+    # acceleration multiplier applied when the combo reaches a given count
+    COMBO_ACCELERATION_MULTIPLIERS = {5: 4.0, 6: 0.375, 10: 4.6666, 11: 0.2857}
+
+    __slots__ = (
+        'is_guranteed_valid_moves', 'width', 'height', 'board', 'score', 'combo', 'not_combo_counter',
+        'score_increment', 'score_incremental_acceleration', 'game_over', 'name_to_pieces', 'name_to_size',
+        'all_piece_names', 'piece_ids', 'piece_sizes', 'piece_masks', 'piece_cell_offsets',
+        'valid_origin_masks', 'piece_mask_at', 'in_bounds', 'piece_bit_count', 'piece_run_shifts',
+        'row_masks', 'col_masks', '_row_reduce_shifts', '_col_reduce_shifts', '_row_start_mask',
+        '_col_start_mask', '_col_hit_shift', 'piece_neighbor_mask_at', 'piece_mask_at_or_zero',
+        'current_pieces', '_piece_pool',
+    )
+
     def __init__(self, board_size: tuple[int, int] = (8, 8), seed: int | None = None, is_guranteed_valid_moves: bool = True):
         if board_size[0] > 64 or board_size[1] > 64:
             raise ValueError("Board dimensions cannot exceed 64.")
@@ -20,178 +265,174 @@ class BlockBlast:
         self.score_incremental_acceleration: float = 0
         self.game_over: bool = False
 
-        self.SCORE_MULTIPLIERS = {1: 1.0, 2: 2.0, 3: 6.0, 4: 12.0, 5: 20.0, 6: 30.0}
-        self.BASE_SCORE_ACCELERATION = 34.2
-
         self._initialize_piece_data()
         self._precompute_masks()
 
-        self.all_piece_names = list(self.name_to_pieces.keys())
         self.current_pieces = []
         
         if seed is not None:
             random.seed(seed)
+
+        # piece indices, partially reshuffled on every deal
+        self._piece_pool = list(range(len(self.all_piece_names)))
         
         self._deal_new_pieces()
 
     def _initialize_piece_data(self):
-        self.name_to_pieces = {
-            'sq1'       : 0b1,
-            'sq2'       : 0b11_11,
-            'sq3'       : 0b111_111_111,
-            'line2h'    : 0b11,
-            'line3h'    : 0b111,
-            'line4h'    : 0b1111,
-            'line5h'    : 0b11111,
-            'line2v'    : 0b1_1,
-            'line3v'    : 0b1_1_1,
-            'line4v'    : 0b1_1_1_1,
-            'line5v'    : 0b1_1_1_1_1,
-            'diag2'     : 0b01_10,
-            'diag3'     : 0b001_010_100,
-            'diag2f'    : 0b10_01,
-            'diag3f'    : 0b100_010_001,
-            'l1'        : 0b10_10_11,
-            'l2'        : 0b111_100,
-            'l3'        : 0b11_01_01,
-            'l4'        : 0b001_111,
-            'l1f'       : 0b01_01_11,
-            'l2f'       : 0b100_111,
-            'l3f'       : 0b11_10_10,
-            'l4f'       : 0b111_001,
-            't1'        : 0b010_111,
-            't2'        : 0b01_11_01,
-            't3'        : 0b111_010,
-            't4'        : 0b10_11_10,
-            's1'        : 0b011_110,
-            's2'        : 0b10_11_01,
-            's1f'       : 0b110_011,
-            's2f'       : 0b01_11_10,
-            'L1'        : 0b100_100_111,
-            'L2'        : 0b111_100_100,
-            'L3'        : 0b111_001_001,
-            'L4'        : 0b001_001_111,
-            'sL1'       : 0b10_11,
-            'sL2'       : 0b11_10,
-            'sL3'       : 0b11_01,
-            'sL4'       : 0b01_11
-        }
-        self.name_to_size = {
-            'sq1'       : (1, 1),
-            'sq2'       : (2, 2),
-            'sq3'       : (3, 3),
-            'line2h'    : (2, 1),
-            'line3h'    : (3, 1),
-            'line4h'    : (4, 1),
-            'line5h'    : (5, 1),
-            'line2v'    : (1, 2),
-            'line3v'    : (1, 3),
-            'line4v'    : (1, 4),
-            'line5v'    : (1, 5),
-            'diag2'     : (2, 2),
-            'diag3'     : (3, 3),
-            'diag2f'    : (2, 2),
-            'diag3f'    : (3, 3),
-            'l1'        : (2, 3),
-            'l2'        : (3, 2),
-            'l3'        : (2, 3),
-            'l4'        : (3, 2),
-            'l1f'       : (2, 3),
-            'l2f'       : (3, 2),
-            'l3f'       : (2, 3),
-            'l4f'       : (3, 2),
-            't1'        : (3, 2),
-            't2'        : (2, 3),
-            't3'        : (3, 2),
-            't4'        : (2, 3),
-            's1'        : (3, 2),
-            's2'        : (2, 3),
-            's1f'       : (3, 2),
-            's2f'       : (2, 3),
-            'L1'        : (3, 3),
-            'L2'        : (3, 3),
-            'L3'        : (3, 3),
-            'L4'        : (3, 3),
-            'sL1'       : (2, 2),
-            'sL2'       : (2, 2),
-            'sL3'       : (2, 2),
-            'sL4'       : (2, 2)
-        }
-        
+        self.name_to_pieces = NAME_TO_PIECES
+        self.name_to_size = NAME_TO_SIZE
+
     def _precompute_masks(self):
-        self.name_to_piece_masks = {}
-        for name, compact_mask in self.name_to_pieces.items():
-            piece_w, piece_h = self.name_to_size[name]
-            scaled_mask = 0
-            for r in range(piece_h):
-                row_bits = (compact_mask >> (r * piece_w)) & ((1 << piece_w) - 1)
-                scaled_mask |= row_bits << (r * self.width)
-            self.name_to_piece_masks[name] = scaled_mask
-        
-        self.row_masks = [((1 << self.width) - 1) << (r * self.width) for r in range(self.height)]
-        self.col_masks = [0] * self.width
-        for c in range(self.width):
-            for r in range(self.height):
-                self.col_masks[c] |= 1 << (r * self.width + c)
-
-    def _can_place_piece(self, board:int, piece_name: str) -> bool:
-        """Checks if a given piece can be placed anywhere on the board. Returns valid position if there is"""
-        for y in random.sample(range(self.height), self.height):
-            for x in random.sample(range(self.width), self.width):
-                if self.is_valid_move(board, piece_name, (x, y)):
-                    return (x, y)
-        return False
+        # built once per board size by _make_tables and shared by every instance
+        tables = _make_tables(self.width, self.height)
+        self.all_piece_names = tables.all_piece_names
+        self.piece_ids = tables.piece_ids
+        self.piece_sizes = tables.piece_sizes
+        self.piece_masks = tables.piece_masks
+        self.piece_cell_offsets = tables.piece_cell_offsets
+        self.valid_origin_masks = tables.valid_origin_masks
+        self.piece_mask_at = tables.piece_mask_at
+        self.in_bounds = tables.in_bounds
+        self.piece_bit_count = tables.piece_bit_count
+        self.piece_run_shifts = tables.piece_run_shifts
+        self.piece_neighbor_mask_at = tables.piece_neighbor_mask_at
+        self.piece_mask_at_or_zero = tables.piece_mask_at_or_zero
+        self.row_masks = tables.row_masks
+        self.col_masks = tables.col_masks
+        self._row_reduce_shifts = tables.row_reduce_shifts
+        self._col_reduce_shifts = tables.col_reduce_shifts
+        self._row_start_mask = tables.row_start_mask
+        self._col_start_mask = tables.col_start_mask
+        self._col_hit_shift = tables.col_hit_shift
+
+    def _clear_lines(self, board: int) -> tuple[int, int]:
+        """Clears every full row and column at once. Returns the new board and the number of lines cleared."""
+        full_rows = board
+        for shift in self._row_reduce_shifts:
+            full_rows &= full_rows >> shift
+        full_rows &= self._row_start_mask
+
+        full_cols = board
+        for shift in self._col_reduce_shifts:
+            full_cols &= full_cols >> shift
+        full_cols &= self._col_start_mask
+
+        # a single bitmap of every full line, with the column bits moved past the board's bits
+        hits = full_rows | full_cols << self._col_hit_shift
+        if not hits:
+            return board, 0
+
+        # multiplying broadcasts each start bit across its whole line
+        cleared_mask = full_rows * self._col_start_mask | full_cols * self._row_start_mask
+        return board & ~cleared_mask, hits.bit_count()
 
     def _deal_new_pieces(self):
-        self.current_pieces = random.sample(self.all_piece_names, 3)
+        """Deals 3 distinct pieces uniformly at random, like random.sample, without building a new list per deal."""
+        pool = self._piece_pool
+        n = len(pool)
+        # partial Fisher-Yates: the first 3 slots end up a uniform sample of the whole pool
+        for k in range(3):
+            j = random.randrange(k, n)
+            pool[k], pool[j] = pool[j], pool[k]
+        self.current_pieces = [self.all_piece_names[i] for i in pool[:3]]
 
-    def _guaranteed_deal_new_pieces(self):
+    def _guaranteed_deal_new_pieces(self) -> bool:
         """
-        Deals a set of 3 new pieces, guarantees at least a way to place all 3 of them on board
+        Deals a set of 3 new pieces, guarantees at least a way to place all 3 of them on board.
+        Falls back to a random deal and returns False if no 3 distinct pieces can all be placed.
         """
-        self.current_pieces = []
-        all_pieces_choices = self.all_piece_names.copy()
-        random.shuffle(all_pieces_choices)
+        picked = []
+        # (board, pieces picked so far) states already known not to lead to a full set
+        failed = set()
 
-        board = self.board
+        def try_fill(board: int, available: list[str]) -> bool:
+            random.shuffle(available)
+            if len(picked) == 2:
+                # the last piece only has to fit somewhere
+                for name in available:
+                    if self._legal_origins(board, self.piece_ids[name]):
+                        picked.append(name)
+                        return True
+                return False
 
-        while True:
-            for name in all_pieces_choices:
-                placable_position = self._can_place_piece(board, name)
-                if placable_position:
-                    board = self.try_move(board, name, placable_position)['board']
-                    self.current_pieces.append(name)
-                    if len(self.current_pieces) == 3:
-                        break
-            if len(self.current_pieces) == 3:
-                break
+            key = (board, frozenset(picked))
+            if key in failed:
+                return False
+            for i, name in enumerate(available):
+                piece_id = self.piece_ids[name]
+                legal = self._legal_origins(board, piece_id)
+                origins = []
+                while legal:
+                    lsb = legal & -legal
+                    origins.append(lsb.bit_length() - 1)
+                    legal ^= lsb
+                # every origin is tried before giving up on the piece, one may block the others where another does not
+                random.shuffle(origins)
+                rest = available[:i] + available[i + 1:]
+                picked.append(name)
+                for pos in origins:
+                    next_board = self._clear_lines(board | self.piece_mask_at[piece_id][pos])[0]
+                    if try_fill(next_board, rest):
+                        return True
+                picked.pop()
+            failed.add(key)
+            return False
+
+        if not try_fill(self.board, list(self.all_piece_names)):
+            self._deal_new_pieces()
+            return False
 
-        random.shuffle(self.current_pieces)
+        random.shuffle(picked)
+        self.current_pieces = picked
+        return True
 
     def _get_piece_mask(self, piece_name: str, position: tuple[int, int]) -> int:
         px, py = position
-        return self.name_to_piece_masks[piece_name] << (py * self.width + px)
+        return self.piece_mask_at[self.piece_ids[piece_name]][py * self.width + px]
 
     def is_valid_move(self, board:int, piece_name: str, position: tuple[int, int]) -> bool:
-        piece_w, piece_h = self.name_to_size[piece_name]
         px, py = position
 
-        if px < 0 or py < 0 or px + piece_w > self.width or py + piece_h > self.height:
+        if px < 0 or py < 0 or px >= self.width or py >= self.height:
             return False
 
-        if (board & self._get_piece_mask(piece_name, position)) != 0:
-            return False
-            
-        return True
+        return self.is_valid_move_fast(board, self.piece_ids[piece_name], py * self.width + px)
+
+    def is_valid_move_fast(self, board: int, piece_id: int, pos_idx: int) -> bool:
+        """is_valid_move for a piece id and an origin already given as y * width + x inside the board."""
+        return self.in_bounds[piece_id][pos_idx] and (board & self.piece_mask_at[piece_id][pos_idx]) == 0
+
+    def _legal_origins(self, board: int, piece_id: int) -> int:
+        """Returns a bitboard whose set bits are every top-left origin the piece can be placed at."""
+        run_shifts = self.piece_run_shifts[piece_id]
+        if run_shifts is not None:
+            blocked = board
+            for shift in run_shifts:
+                blocked |= blocked >> shift
+        else:
+            blocked = 0
+            for offset in self.piece_cell_offsets[piece_id]:
+                blocked |= board >> offset
+        return self.valid_origin_masks[piece_id] & ~blocked
+
+    def _any_piece_fits(self) -> bool:
+        """Whether any current piece can be placed on the board, stopping at the first that fits."""
+        for name in self.current_pieces:
+            if self._legal_origins(self.board, self.piece_ids[name]):
+                return True
+        return False
 
     def get_valid_moves(self) -> dict[str, list[tuple[int, int]]]:
         possible_moves = {}
+        width = self.width
         for name in self.current_pieces:
+            legal = self._legal_origins(self.board, self.piece_ids[name])
             moves = []
-            for r in range(self.height):
-                for c in range(self.width):
-                    if self.is_valid_move(self.board, name, (c, r)):
-                        moves.append((c, r))
+            while legal:
+                lsb = legal & -legal
+                idx = lsb.bit_length() - 1
+                moves.append((idx % width, idx // width))
+                legal ^= lsb
             if moves:
                 possible_moves[name] = moves
         return possible_moves
@@ -218,24 +459,11 @@ class BlockBlast:
             return {"status": "error", "message": "Invalid move."}
         
         self.board |= self._get_piece_mask(piece_name, position)
-        self.score += self.name_to_pieces[piece_name].bit_count()
-        
-        lines_cleared = 0
-        cleared_mask = 0
+        self.score += self.piece_bit_count[self.piece_ids[piece_name]]
         
-        for row_mask in self.row_masks:
-            if (self.board & row_mask) == row_mask:
-                lines_cleared += 1
-                cleared_mask |= row_mask
-                
-        for col_mask in self.col_masks:
-            if (self.board & col_mask) == col_mask:
-                lines_cleared += 1
-                cleared_mask |= col_mask
+        self.board, lines_cleared = self._clear_lines(self.board)
         
         if lines_cleared > 0:
-            self.board &= ~cleared_mask
-
             if self.not_combo_counter + lines_cleared <= 1:
                 self.combo = -1
                 self.score_increment = 0
@@ -243,12 +471,10 @@ class BlockBlast:
             self.not_combo_counter = 3
             self.combo += 1
             
-            match self.combo:
-                case 0: self.score_incremental_acceleration = self.BASE_SCORE_ACCELERATION
-                case 5: self.score_incremental_acceleration *= 4
-                case 6: self.score_incremental_acceleration *= 0.375
-                case 10: self.score_incremental_acceleration *= 4.6666
-                case 11: self.score_incremental_acceleration *= 0.2857
+            if self.combo == 0:
+                self.score_incremental_acceleration = self.BASE_SCORE_ACCELERATION
+            else:
+                self.score_incremental_acceleration *= self.COMBO_ACCELERATION_MULTIPLIERS.get(self.combo, 1.0)
             
             self.score_increment += self.score_incremental_acceleration
             self.score += int(self.score_increment * self.SCORE_MULTIPLIERS.get(lines_cleared, 30.0))
@@ -256,13 +482,15 @@ class BlockBlast:
             self.not_combo_counter -= 1
 
         self.current_pieces.remove(piece_name)
+        dealt_fitting = False
         if not self.current_pieces:
             if self.is_guranteed_valid_moves:
-                self._guaranteed_deal_new_pieces()
+                dealt_fitting = self._guaranteed_deal_new_pieces()
             else:
                 self._deal_new_pieces()
-        
-        if not self.get_valid_moves():
+
+        # a successful guaranteed deal always fits, no need to look for a move
+        if not dealt_fitting and not self._any_piece_fits():
             self.game_over = True
             
         return {
@@ -279,24 +507,10 @@ class BlockBlast:
         
         board |= self._get_piece_mask(piece_name, position)
         
-        lines_cleared = 0
-        cleared_mask = 0
-        
-        for row_mask in self.row_masks:
-            if (board & row_mask) == row_mask:
-                lines_cleared += 1
-                cleared_mask |= row_mask
-                
-        for col_mask in self.col_masks:
-            if (board & col_mask) == col_mask:
-                lines_cleared += 1
-                cleared_mask |= col_mask
-        
-        if lines_cleared > 0:
-            board &= ~cleared_mask
+        board, lines_cleared = self._clear_lines(board)
         
         game_over = False
-        if not self.get_valid_moves():
+        if not self._any_piece_fits():
             game_over = True
             
         return {
@@ -311,11 +525,11 @@ class BlockBlast:
     def render(self):
         print(f"Score: {self.score}")
         print("_" * (self.width * 2 + 1))
+        row_mask = (1 << self.width) - 1
         for r in range(self.height):
-            row_str = "|"
-            for c in range(self.width):
-                row_str += "■ " if (self.board >> (r * self.width + c)) & 1 else ". "
-            print(row_str.strip() + "|")
+            # column 0 is the lowest bit, so the binary string reads right to left
+            row_bits = format((self.board >> (r * self.width)) & row_mask, f'0{self.width}b')[::-1]
+            print("|" + " ".join(row_bits.translate(RENDER_CELLS)) + "|")
         print("-" * (self.width * 2 + 1))
         if not self.game_over:
             print("Available Pieces:", self.current_pieces)
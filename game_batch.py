@@ -0,0 +1,152 @@
+"""
+Lockstep play of many independent Block Blast games, with every board held as one uint64 in a NumPy array.
+Boards must have at most 64 cells. Scoring follows BlockBlast.make_move; pieces are dealt uniformly
+at random (the guaranteed deal is not supported).
+
+Pass `xp=cupy` to keep every array on the GPU; the code only uses the API NumPy and CuPy share.
+"""
+import numpy as np
+
+from game import BlockBlast, _make_tables
+
+
+class BatchBlockBlast:
+    def __init__(self, num_games: int, board_size: tuple[int, int] = (8, 8), seed: int | None = None, xp=np):
+        if board_size[0] * board_size[1] > 64:
+            raise ValueError("Batched boards cannot have more than 64 cells.")
+
+        # shared board tables, read directly so no game is created and the global random stream is untouched
+        tables = _make_tables(*board_size)
+        self.xp = xp
+        self.width, self.height = board_size
+        self.num_games = num_games
+        self.all_piece_names = tables.all_piece_names
+        self.BASE_SCORE_ACCELERATION = BlockBlast.BASE_SCORE_ACCELERATION
+
+        # piece_masks[p, pos] is 0 where piece p would leave the board from origin pos
+        piece_masks = np.array(tables.piece_mask_at_or_zero, dtype=np.uint64)
+        pos_in_bounds = piece_masks != 0
+        line_masks = np.array(tables.row_masks + tables.col_masks, dtype=np.uint64)
+        score_multipliers = np.array(
+            [0.0] + [BlockBlast.SCORE_MULTIPLIERS.get(n, 30.0) for n in range(1, len(line_masks) + 1)]
+        )
+
+        self.pos_in_bounds = xp.asarray(pos_in_bounds)
+        self.piece_masks = xp.asarray(piece_masks)
+        self.piece_bit_count = xp.asarray(tables.piece_bit_count, dtype=xp.int64)
+        # kept on the host, it is only iterated over
+        self.line_masks = line_masks
+        self.score_multipliers = xp.asarray(score_multipliers)
+        # acceleration multiplier indexed by combo count, past the end it is 1.0
+        combo_multipliers = BlockBlast.COMBO_ACCELERATION_MULTIPLIERS
+        self.combo_acceleration = xp.asarray(
+            [combo_multipliers.get(c, 1.0) for c in range(max(combo_multipliers) + 1)]
+        )
+
+        self.rng = xp.random.default_rng(seed)
+        self.reset()
+
+    def reset(self):
+        xp = self.xp
+        n = self.num_games
+        self.boards = xp.zeros(n, dtype=xp.uint64)
+        self.scores = xp.zeros(n, dtype=xp.int64)
+        self.combo = xp.full(n, -1, dtype=xp.int64)
+        self.not_combo_counter = xp.full(n, 3, dtype=xp.int64)
+        self.score_increment = xp.zeros(n)
+        self.score_incremental_acceleration = xp.zeros(n)
+        self.alive = xp.ones(n, dtype=xp.bool_)
+        # piece ids in each game's hand, -1 once placed
+        self.current_pieces = xp.full((n, 3), -1, dtype=xp.int64)
+        self._deal_new_pieces(xp.ones(n, dtype=xp.bool_))
+
+    def _deal_new_pieces(self, games: np.ndarray):
+        count = int(games.sum())
+        if count:
+            # three distinct pieces per game
+            self.current_pieces[games] = self.rng.random((count, len(self.all_piece_names))).argsort(axis=1)[:, :3]
+
+    def _any_piece_fits(self) -> np.ndarray:
+        xp = self.xp
+        fits = xp.zeros(self.num_games, dtype=xp.bool_)
+        boards = self.boards[:, None]
+        for slot in range(self.current_pieces.shape[1]):
+            pieces = self.current_pieces[:, slot]
+            held = pieces >= 0
+            ids = xp.where(held, pieces, 0)
+            slot_fits = (self.pos_in_bounds[ids] & ((boards & self.piece_masks[ids]) == 0)).any(axis=1)
+            fits |= held & slot_fits
+        return fits
+
+    def apply(self, piece_ids: np.ndarray, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Plays piece_ids[i] at origin positions[i] (y * width + x) in every game i at once.
+        Moves in finished games, with pieces not in hand, origins off the board or that do not fit are ignored.
+        Returns which moves were applied and the lines each one cleared.
+        """
+        xp = self.xp
+        piece_ids = xp.asarray(piece_ids, dtype=xp.int64)
+        positions = xp.asarray(positions, dtype=xp.int64)
+
+        # placed slots hold -1, so out of range ids must not match them or wrap around in the gathers
+        num_pieces, num_cells = self.piece_masks.shape
+        in_range = (piece_ids >= 0) & (piece_ids < num_pieces) & (positions >= 0) & (positions < num_cells)
+        piece_ids = xp.where(in_range, piece_ids, 0)
+        positions = xp.where(in_range, positions, 0)
+
+        in_hand = (self.current_pieces == piece_ids[:, None]) & in_range[:, None]
+        masks = self.piece_masks[piece_ids, positions]
+        legal = (
+            self.alive
+            & in_hand.any(axis=1)
+            & self.pos_in_bounds[piece_ids, positions]
+            & ((self.boards & masks) == 0)
+        )
+
+        boards = xp.where(legal, self.boards | masks, self.boards)
+        self.scores += xp.where(legal, self.piece_bit_count[piece_ids], 0)
+
+        lines_cleared = xp.zeros(self.num_games, dtype=xp.int64)
+        cleared_mask = xp.zeros(self.num_games, dtype=xp.uint64)
+        for line in self.line_masks:
+            full = (boards & line) == line
+            lines_cleared += full
+            cleared_mask[full] |= line
+        self.boards = boards & ~cleared_mask
+
+        self._update_score(legal, lines_cleared)
+
+        # take the placed piece out of the hand, the first matching slot only
+        slot = in_hand.argmax(axis=1)
+        placed = legal[:, None] & (xp.arange(3) == slot[:, None])
+        self.current_pieces[placed] = -1
+
+        self._deal_new_pieces(legal & (self.current_pieces < 0).all(axis=1))
+        self.alive &= self._any_piece_fits()
+
+        return legal, lines_cleared
+
+    def _update_score(self, legal: np.ndarray, lines_cleared: np.ndarray):
+        xp = self.xp
+        cleared = legal & (lines_cleared > 0)
+
+        broken = cleared & (self.not_combo_counter + lines_cleared <= 1)
+        self.combo[broken] = -1
+        self.score_increment[broken] = 0
+
+        self.not_combo_counter[cleared] = 3
+        self.not_combo_counter[legal & ~cleared] -= 1
+        self.combo[cleared] += 1
+
+        combo = self.combo[cleared]
+        accel = self.score_incremental_acceleration[cleared]
+        last = len(self.combo_acceleration) - 1
+        multiplier = xp.where(combo <= last, self.combo_acceleration[xp.minimum(combo, last)], 1.0)
+        self.score_incremental_acceleration[cleared] = xp.where(
+            combo == 0, self.BASE_SCORE_ACCELERATION, accel * multiplier
+        )
+
+        self.score_increment[cleared] += self.score_incremental_acceleration[cleared]
+        self.scores[cleared] += (
+            self.score_increment[cleared] * self.score_multipliers[lines_cleared[cleared]]
+        ).astype(xp.int64)
@@ -0,0 +1,119 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Native bitboard core used by bots.simple.Solver for boards of at most 64 cells.
+
+Build in place with `cythonize -i game_core.pyx`; the solver falls back to pure Python
+when the extension is not built or the board does not fit in a uint64.
+"""
+from libc.stdint cimport uint64_t
+
+cdef enum:
+    MAX_PIECES = 64
+    MAX_CELLS = 64
+    MAX_HAND = 8
+
+cdef uint64_t NOMOVE = 0xFFFFFFFFFFFFFFFF
+
+# PIECE_MASK[p][pos] is piece p shifted to origin pos, or 0 where it would leave the board
+cdef uint64_t PIECE_MASK[MAX_PIECES][MAX_CELLS]
+cdef uint64_t ROW_MASK[MAX_CELLS]
+cdef uint64_t COL_MASK[MAX_CELLS]
+cdef int WIDTH = 0
+cdef int HEIGHT = 0
+cdef int NUM_CELLS = 0
+cdef int NUM_PIECES = 0
+cdef object _loaded_key = None
+
+
+def load(int width, int height, piece_masks, row_masks, col_masks):
+    """Fills the C tables from the game's Python tables. A no-op if this board size is already loaded."""
+    global WIDTH, HEIGHT, NUM_CELLS, NUM_PIECES, _loaded_key
+    cdef int p, pos, i
+
+    key = (width, height, len(piece_masks))
+    if key == _loaded_key:
+        return
+    if width * height > MAX_CELLS or len(piece_masks) > MAX_PIECES:
+        raise ValueError("game_core only supports boards of at most 64 cells and 64 pieces.")
+
+    for p in range(len(piece_masks)):
+        for pos in range(width * height):
+            PIECE_MASK[p][pos] = piece_masks[p][pos]
+    for i in range(height):
+        ROW_MASK[i] = row_masks[i]
+    for i in range(width):
+        COL_MASK[i] = col_masks[i]
+
+    WIDTH, HEIGHT, NUM_CELLS, NUM_PIECES = width, height, width * height, len(piece_masks)
+    _loaded_key = key
+
+
+cdef inline uint64_t try_place(uint64_t board, int p, int pos) noexcept nogil:
+    # Places piece p at origin pos and clears full lines. Returns NOMOVE if the placement is invalid.
+    # p and pos are not checked, solve validates the piece ids and only passes origins on the board.
+    cdef uint64_t m = PIECE_MASK[p][pos]
+    cdef uint64_t cleared = 0
+    cdef int i
+
+    if m == 0 or (board & m) != 0:
+        return NOMOVE
+    board |= m
+
+    for i in range(HEIGHT):
+        if (board & ROW_MASK[i]) == ROW_MASK[i]:
+            cleared |= ROW_MASK[i]
+    for i in range(WIDTH):
+        if (board & COL_MASK[i]) == COL_MASK[i]:
+            cleared |= COL_MASK[i]
+
+    return board & ~cleared
+
+
+cdef bint _dfs(uint64_t board, const int *hand, int n, int remaining, int depth,
+               int *out_slot, int *out_pos) noexcept nogil:
+    cdef int i, pos
+    cdef uint64_t next_board
+
+    if remaining == 0:
+        return True
+    for i in range(n):
+        if not (remaining >> i) & 1:
+            continue
+        for pos in range(NUM_CELLS):
+            next_board = try_place(board, hand[i], pos)
+            if next_board == NOMOVE:
+                continue
+            if _dfs(next_board, hand, n, remaining ^ (1 << i), depth + 1, out_slot, out_pos):
+                out_slot[depth] = i
+                out_pos[depth] = pos
+                return True
+    return False
+
+
+cpdef list solve(uint64_t board, tuple pieces):
+    """
+    Searches for an order and origins that place every piece in `pieces` (piece indices).
+    Returns [(piece, pos), ...] in play order, or None if there is no solution.
+    """
+    cdef int hand[MAX_HAND]
+    cdef int out_slot[MAX_HAND]
+    cdef int out_pos[MAX_HAND]
+    cdef int n = len(pieces)
+    cdef int i
+    cdef bint found
+
+    if _loaded_key is None:
+        raise RuntimeError("game_core.load must be called before solve.")
+    if n > MAX_HAND:
+        raise ValueError(f"game_core can only solve hands of up to {MAX_HAND} pieces.")
+    for i in range(n):
+        if not 0 <= pieces[i] < NUM_PIECES:
+            raise ValueError(f"Piece id {pieces[i]} is not one of the {NUM_PIECES} loaded pieces.")
+        hand[i] = pieces[i]
+
+    with nogil:
+        found = _dfs(board, hand, n, (1 << n) - 1, 0, out_slot, out_pos)
+
+    if not found:
+        return None
+    return [(hand[out_slot[i]], out_pos[i]) for i in range(n)]
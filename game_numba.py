@@ -0,0 +1,104 @@
+"""
+Numba-compiled bitboard solver, used by bots.simple.Solver when the Cython core (game_core.pyx)
+is not built. Boards must have at most 64 cells so each one fits in a uint64.
+"""
+from __future__ import annotations
+import typing
+
+import numpy as np
+from numba import njit
+
+if typing.TYPE_CHECKING:
+    from game import BlockBlast
+
+
+def build_tables(game: BlockBlast) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Packs the game's piece tables into arrays indexed by piece id (position in `all_piece_names`):
+    piece_masks[p, pos], pos_in_bounds[p, pos], row_masks and col_masks.
+    Out of bounds masks are stored as 0, they would not fit in a uint64.
+    """
+    piece_masks = np.array(game.piece_mask_at_or_zero, dtype=np.uint64)
+    pos_in_bounds = piece_masks != 0
+    row_masks = np.array(game.row_masks, dtype=np.uint64)
+    col_masks = np.array(game.col_masks, dtype=np.uint64)
+    return piece_masks, pos_in_bounds, row_masks, col_masks
+
+
+def solve(board: int, piece_ids: list[int], tables: tuple) -> list[tuple[int, int]] | None:
+    """Runs solve_nb on python values. Returns [(piece_id, pos), ...] in play order, or None."""
+    result = solve_nb(np.uint64(board), np.array(piece_ids, dtype=np.int64), *tables)
+    if len(result) and result[0, 0] < 0:
+        return None
+    return [(int(p), int(pos)) for p, pos in result]
+
+
+@njit(cache=True)
+def _try_place(board, mask, row_masks, col_masks):
+    board |= mask
+    cleared = np.uint64(0)
+    for line in row_masks:
+        if (board & line) == line:
+            cleared |= line
+    for line in col_masks:
+        if (board & line) == line:
+            cleared |= line
+    return board & ~cleared
+
+
+@njit(cache=True)
+def solve_nb(board, piece_ids, piece_masks, pos_in_bounds, row_masks, col_masks):
+    """
+    Depth-first search with an explicit stack for an order and origins that place every piece in `piece_ids`.
+    Returns an int32[n, 2] array of (piece_id, pos) rows in play order, filled with -1 if there is no solution.
+    """
+    n = piece_ids.shape[0]
+    num_cells = piece_masks.shape[1]
+    result = np.full((n, 2), -1, np.int32)
+
+    # per-depth stack: board before the move, and the (slot, pos) to resume trying from
+    boards = np.zeros(n + 1, np.uint64)
+    slots = np.zeros(n + 1, np.int64)
+    positions = np.zeros(n + 1, np.int64)
+    boards[0] = board
+    used = 0
+    depth = 0
+
+    while depth >= 0:
+        if depth == n:
+            return result
+
+        found = False
+        slot = slots[depth]
+        pos = positions[depth]
+        while slot < n:
+            if not (used >> slot) & 1:
+                p = piece_ids[slot]
+                while pos < num_cells:
+                    if pos_in_bounds[p, pos] and (boards[depth] & piece_masks[p, pos]) == 0:
+                        found = True
+                        break
+                    pos += 1
+                if found:
+                    break
+            slot += 1
+            pos = 0
+
+        if found:
+            p = piece_ids[slot]
+            result[depth, 0] = p
+            result[depth, 1] = pos
+            slots[depth] = slot
+            positions[depth] = pos + 1
+            used |= 1 << slot
+            boards[depth + 1] = _try_place(boards[depth], piece_masks[p, pos], row_masks, col_masks)
+            depth += 1
+            slots[depth] = 0
+            positions[depth] = 0
+        else:
+            depth -= 1
+            if depth >= 0:
+                used ^= 1 << slots[depth]
+
+    result[:] = -1
+    return result
@@ -1,9 +1,11 @@
+from __future__ import annotations
 import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
 
 import pygame
 import sys
 import math
+import typing
 from game import BlockBlast
 
 class BlockBlastVisuallized(BlockBlast):
@@ -18,6 +20,9 @@ class BlockBlastVisuallized(BlockBlast):
         self.tray_scale_factor = 0.5
         self.block_padding = 2
         self.hud_top_offset = 120
+        self.animation_scale_steps = 12
+        # background of the opaque piece surfaces, never drawn itself
+        self.colorkey = (255, 0, 255)
 
         # Screen Dimensions
         board_pixel_width = self.width * self.cell_size
@@ -26,9 +31,17 @@ class BlockBlastVisuallized(BlockBlast):
         window_width = board_pixel_width + pieces_panel_width + 3 * self.margin
         window_height = board_pixel_height + 2 * self.margin
 
+        # a plain window surface, so _present's display.update(rects) uploads only the drawn areas;
+        # SCALED would route it through a renderer where every update is a full flip
         self.screen = pygame.display.set_mode((window_width, window_height))
         pygame.display.set_caption("Block Blast")
 
+        # only these events are handled; the mouse position is polled, so the flood of MOUSEMOTION
+        # events is dropped by SDL instead of being queued and iterated over every frame
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN,
+                                  pygame.VIDEOEXPOSE])
+
         # Colors
         self.colors = {
             "background": (20, 30, 40), "grid": (40, 60, 80),
@@ -49,6 +62,55 @@ class BlockBlastVisuallized(BlockBlast):
             self.increment_font = pygame.font.Font(None, 28)
 
         self.game_over_font = pygame.font.Font(None, 72)
+
+        # (row, col) of every filled cell of each piece
+        self._piece_cells = {}
+        for piece_name, piece_mask in self.name_to_pieces.items():
+            piece_w, piece_h = self.name_to_size[piece_name]
+            self._piece_cells[piece_name] = tuple(
+                (r, c) for r in range(piece_h) for c in range(piece_w) if (piece_mask >> (r * piece_w + c)) & 1
+            )
+
+        # screen rect of every board cell and of the block drawn inside it, indexed by bit position
+        self._cell_rects = [pygame.Rect(self.margin + c * self.cell_size, self.margin + r * self.cell_size,
+                                        self.cell_size, self.cell_size)
+                            for r in range(self.height) for c in range(self.width)]
+        self._block_rects = [rect.inflate(-self.block_padding * 2, -self.block_padding * 2) for rect in self._cell_rects]
+
+        # Every cached surface is converted to the display's pixel format once, so blitting it needs no conversion
+
+        # one translucent ghost block, blitted once per cell of the ghost piece
+        block_size = self.cell_size - 2 * self.block_padding
+        self._ghost_cell_surface = pygame.Surface((block_size, block_size), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.rect(self._ghost_cell_surface, self.colors["ghost"], self._ghost_cell_surface.get_rect(), border_radius=3)
+
+        # Render caches: the board is redrawn only when self.board changes,
+        # HUD text only when the value it shows changes
+        self._board_surface = pygame.Surface((board_pixel_width, board_pixel_height)).convert()
+        # the board is composed from an empty grid plus one filled cell blitted per set bit
+        self._empty_grid_surface = pygame.Surface((board_pixel_width, board_pixel_height)).convert()
+        self._empty_grid_surface.fill(self.colors["background"])
+        for rect in self._cell_rects:
+            pygame.draw.rect(self._empty_grid_surface, self.colors["grid"], rect.move(-self.margin, -self.margin))
+        self._filled_cell_surface = pygame.Surface((self.cell_size, self.cell_size)).convert()
+        self._filled_cell_surface.fill(self.colors["grid"])
+        block_rect = self._filled_cell_surface.get_rect().inflate(-self.block_padding * 2, -self.block_padding * 2)
+        pygame.draw.rect(self._filled_cell_surface, self.colors["block"], block_rect, border_radius=3)
+        self._board_cache_key = None
+        self._score_cache = {}
+        self._combo_cache = {}
+        # piece surfaces keyed by (piece_name, cell_size, padding), built up front for the board and tray sizes
+        self._piece_surface_cache = {}
+        for piece_name in self.all_piece_names:
+            self._create_piece_surface(piece_name, self.cell_size, self.block_padding)
+            self._create_piece_surface(piece_name, int(self.cell_size * self.tray_scale_factor), self.block_padding / 2)
+        # validity of the last ghost drawn, keyed by (board, piece_name, grid_pos)
+        self._ghost_last_key = None
+        self._ghost_last_valid = False
+        # per piece drag surfaces prescaled for the pickup and drop animations, built up front like the piece surfaces
+        self._scale_frames_cache = {}
+        for piece_name in self.all_piece_names:
+            self._get_scale_frames(piece_name)
         
         # UI State & HUD
         self.ui_state = 'IDLE'
@@ -62,11 +124,22 @@ class BlockBlastVisuallized(BlockBlast):
         
         # Bot control
         self.autoplay = False
+        # autoplay moves at most once per interval, independently of the frame rate
+        self._bot_interval_ms = 100
+        self._last_bot_time = 0
+
+        # set whenever the next frame differs from the one on screen
+        self._dirty = True
+        # screen areas drawn this frame and the last one; only their union is pushed to the display
+        self._dirty_rects = []
+        self._prev_dirty_rects = []
+        self._full_redraw = True
     
     # Overriding make_move to capture the score change for the HUD
     def make_move(self, piece_name: str, position: tuple[int, int]) -> dict:
         score_before = self.score
         result = super().make_move(piece_name, position)
+        self._dirty = True
         
         if result.get("status") == "success":
             score_after = self.score
@@ -77,58 +150,112 @@ class BlockBlastVisuallized(BlockBlast):
         
         return result
 
-    def _create_piece_surface(self, piece_name, cell_size, padding):
-        """Helper to create a surface for a given piece."""
+    def _to_grid(self, top_left: tuple[float, float]) -> tuple[int, int]:
+        """Snaps a screen position to the nearest board cell, as (x, y)."""
+        cs = self.cell_size
+        m = self.margin
+        half = cs // 2
+        return ((int(top_left[0]) - m + half) // cs, (int(top_left[1]) - m + half) // cs)
+
+    def _present(self) -> None:
+        """Pushes the areas drawn this frame and the last one to the display, the whole window on the first frame."""
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            # last frame's areas erase whatever moved away or disappeared since
+            pygame.display.update(self._dirty_rects + self._prev_dirty_rects)
+        self._prev_dirty_rects, self._dirty_rects = self._dirty_rects, []
+
+    def _create_piece_surface(self, piece_name: str, cell_size: int, padding: float) -> pygame.Surface:
+        """Returns the cached surface for a given piece, building it on first use."""
+        key = (piece_name, cell_size, padding)
+        surface = self._piece_surface_cache.get(key)
+        if surface is None:
+            surface = self._piece_surface_cache[key] = self._build_piece_surface(piece_name, cell_size, padding)
+        return surface
+
+    def _build_piece_surface(self, piece_name: str, cell_size: int, padding: float, translucent: bool = False) -> pygame.Surface:
+        """
+        Helper to create a surface for a given piece. Its background is transparent through a
+        colorkey, which blits RLE accelerated; `translucent` gives it a real alpha channel instead.
+        """
         piece_w, piece_h = self.name_to_size[piece_name]
-        surface = pygame.Surface((piece_w * cell_size, piece_h * cell_size), pygame.SRCALPHA)
-        piece_mask = self.name_to_pieces[piece_name]
-        
-        for r in range(piece_h):
-            for c in range(piece_w):
-                if (piece_mask >> (r * piece_w + c)) & 1:
-                    rect = pygame.Rect(c * cell_size + padding, r * cell_size + padding,
-                                      cell_size - 2 * padding, cell_size - 2 * padding)
-                    pygame.draw.rect(surface, self.colors["block"], rect, border_radius=3)
+        if translucent:
+            surface = pygame.Surface((piece_w * cell_size, piece_h * cell_size), pygame.SRCALPHA).convert_alpha()
+        else:
+            surface = pygame.Surface((piece_w * cell_size, piece_h * cell_size)).convert()
+            surface.fill(self.colorkey)
+            surface.set_colorkey(self.colorkey, pygame.RLEACCEL)
+
+        for r, c in self._piece_cells[piece_name]:
+            rect = pygame.Rect(c * cell_size + padding, r * cell_size + padding,
+                               cell_size - 2 * padding, cell_size - 2 * padding)
+            pygame.draw.rect(surface, self.colors["block"], rect, border_radius=3)
         return surface
 
-    def draw_board(self):
+    def _get_scale_frames(self, piece_name: str) -> list[pygame.Surface]:
+        """Returns the drag surface of a piece scaled in even steps from the tray scale up to full size."""
+        frames = self._scale_frames_cache.get(piece_name)
+        if frames is None:
+            # smoothscale blends edge pixels with the background, which must be transparent rather than the colorkey
+            surface = self._build_piece_surface(piece_name, self.cell_size, self.block_padding, translucent=True)
+            w, h = surface.get_size()
+            steps = self.animation_scale_steps - 1
+            frames = []
+            for i in range(steps + 1):
+                scale = self.tray_scale_factor + (1.0 - self.tray_scale_factor) * i / steps
+                frames.append(pygame.transform.smoothscale(surface, (int(w * scale), int(h * scale))).convert_alpha())
+            self._scale_frames_cache[piece_name] = frames
+        return frames
+
+    def draw_board(self) -> None:
         """Renders the game board with borders around the blocks."""
         self.screen.fill(self.colors["background"])
-        
-        for r in range(self.height):
-            for c in range(self.width):
-                rect = pygame.Rect(self.margin + c * self.cell_size, self.margin + r * self.cell_size,
-                                  self.cell_size, self.cell_size)
-                is_filled = (self.board >> (r * self.width + c)) & 1
-                color = self.colors["grid"]
-                pygame.draw.rect(self.screen, color, rect)
-                if is_filled:
-                    block_rect = rect.inflate(-self.block_padding * 2, -self.block_padding * 2)
-                    pygame.draw.rect(self.screen, self.colors["block"], block_rect, border_radius=3)
+
+        if self.board != self._board_cache_key:
+            self._board_surface.blit(self._empty_grid_surface, (0, 0))
+            board = self.board
+            while board:
+                lsb = board & -board
+                r, c = divmod(lsb.bit_length() - 1, self.width)
+                self._board_surface.blit(self._filled_cell_surface, (c * self.cell_size, r * self.cell_size))
+                board ^= lsb
+            self._board_cache_key = self.board
+            self._dirty_rects.append(self.screen.blit(self._board_surface, (self.margin, self.margin)))
+        else:
+            self.screen.blit(self._board_surface, (self.margin, self.margin))
     
-    def draw_hud(self):
+    def draw_hud(self) -> None:
         """Renders the full HUD: Score, Score Increment, and Combo."""
         panel_x_start = self.width * self.cell_size + 2 * self.margin
         panel_center_x = panel_x_start + (self.screen.get_width() - panel_x_start) / 2
 
-        score_surface = self.score_font.render(f"Score: {self.score}", True, self.colors["text"])
+        score_surface = self._score_cache.get(self.score)
+        if score_surface is None:
+            # only the current score is kept, it rarely repeats once it has changed
+            self._score_cache.clear()
+            score_surface = self._score_cache[self.score] = self.score_font.render(f"Score: {self.score}", True, self.colors["text"]).convert_alpha()
         score_rect = score_surface.get_rect(center=(panel_center_x, 40))
-        self.screen.blit(score_surface, score_rect)
+        self._dirty_rects.append(self.screen.blit(score_surface, score_rect))
 
         if self.score_increment_alpha > 0:
             increment_surface = self.increment_font.render(f"+{self.last_score_increment}", True, self.colors["score_increment"])
             increment_surface.set_alpha(self.score_increment_alpha)
             increment_rect = increment_surface.get_rect(center=(panel_center_x, 70))
-            self.screen.blit(increment_surface, increment_rect)
-
-        combo_text = f"Combo: {self.combo + 1}x"
-        combo_color = self.colors["combo_text"] if self.combo > 0 else self.colors["text"]
-        combo_surface = self.combo_font.render(combo_text, True, combo_color)
+            self._dirty_rects.append(self.screen.blit(increment_surface, increment_rect))
+
+        combo_surface = self._combo_cache.get(self.combo)
+        if combo_surface is None:
+            combo_text = f"Combo: {self.combo + 1}x"
+            combo_color = self.colors["combo_text"] if self.combo > 0 else self.colors["text"]
+            # keyed by the combo itself, so the colour switch at combo 0 needs no invalidation
+            combo_surface = self._combo_cache[self.combo] = self.combo_font.render(combo_text, True, combo_color).convert_alpha()
         combo_rect = combo_surface.get_rect(center=(panel_center_x, 95))
-        self.screen.blit(combo_surface, combo_rect)
+        self._dirty_rects.append(self.screen.blit(combo_surface, combo_rect))
 
 
-    def draw_pieces_in_tray(self):
+    def draw_pieces_in_tray(self) -> None:
         """Renders available pieces below the HUD."""
         self.piece_tray_rects.clear()
         
@@ -149,31 +276,31 @@ class BlockBlastVisuallized(BlockBlast):
             piece_x = slot_center_x - surface.get_width() / 2
             
             self.piece_tray_rects[piece_name] = self.screen.blit(surface, (piece_x, piece_y))
+            self._dirty_rects.append(self.piece_tray_rects[piece_name])
 
-    def draw_ghost_piece(self, piece_name, grid_pos):
+    def draw_ghost_piece(self, piece_name: str, grid_pos: tuple[int, int]) -> None:
         """Draws a semi-transparent preview with borders."""
         px, py = grid_pos
-        if self.is_valid_move(self.board, piece_name, (px, py)):
-            piece_w, piece_h = self.name_to_size[piece_name]
-            for r in range(piece_h):
-                for c in range(piece_w):
-                    if (self.name_to_pieces[piece_name] >> (r * piece_w + c)) & 1:
-                        rect = pygame.Rect(self.margin + (c + px) * self.cell_size,
-                                           self.margin + (r + py) * self.cell_size,
-                                           self.cell_size, self.cell_size)
-                        block_rect = rect.inflate(-self.block_padding * 2, -self.block_padding * 2)
-                        
-                        s = pygame.Surface(block_rect.size, pygame.SRCALPHA)
-                        pygame.draw.rect(s, self.colors["ghost"], s.get_rect(), border_radius=3)
-                        self.screen.blit(s, block_rect.topleft)
-
-    def handle_input(self):
+        # the mouse rarely crosses into another cell between frames, so only recheck when the key changes
+        key = (self.board, piece_name, grid_pos)
+        if key != self._ghost_last_key:
+            self._ghost_last_valid = self.is_valid_move(self.board, piece_name, (px, py))
+            self._ghost_last_key = key
+        if self._ghost_last_valid:
+            origin = py * self.width + px
+            self._dirty_rects += self.screen.blits([(self._ghost_cell_surface, self._block_rects[origin + r * self.width + c])
+                                                    for r, c in self._piece_cells[piece_name]])
+
+    def handle_input(self) -> None:
         """Manages user input, starting animations but not during them."""
         if self.ui_state not in ['IDLE', 'DRAGGING']: return
 
         for event in pygame.event.get():
+            self._dirty = True
             if event.type == pygame.QUIT:
                 pygame.quit(), sys.exit()
+            if event.type == pygame.VIDEOEXPOSE:
+                self._full_redraw = True
 
             if self.game_over: continue
 
@@ -183,7 +310,9 @@ class BlockBlastVisuallized(BlockBlast):
                         self.ui_state = 'ANIMATING_PICKUP'
                         self.drag_info = {
                             'name': piece_name,
-                            'surface': self._create_piece_surface(piece_name, self.cell_size, self.block_padding),
+                            # prebuilt in __init__, nothing is drawn at the moment of the click
+                            'surface': self._piece_surface_cache[(piece_name, self.cell_size, self.block_padding)],
+                            'scale_frames': self._get_scale_frames(piece_name),
                             'tray_rect': rect, 'offset': (event.pos[0] - rect.x, event.pos[1] - rect.y)
                         }
                         self.animation = {'start_time': pygame.time.get_ticks(), 'duration': 150,
@@ -194,8 +323,7 @@ class BlockBlastVisuallized(BlockBlast):
                 mouse_pos = event.pos
                 scaled_offset = (self.drag_info['offset'][0] / self.tray_scale_factor, self.drag_info['offset'][1] / self.tray_scale_factor)
                 top_left_pos = (mouse_pos[0] - scaled_offset[0], mouse_pos[1] - scaled_offset[1])
-                grid_pos = (round((top_left_pos[0] - self.margin) / self.cell_size),
-                            round((top_left_pos[1] - self.margin) / self.cell_size))
+                grid_pos = self._to_grid(top_left_pos)
                 
                 self.ui_state = 'ANIMATING_DROP'
                 is_valid = self.is_valid_move(self.board, self.drag_info['name'], grid_pos)
@@ -205,110 +333,149 @@ class BlockBlastVisuallized(BlockBlast):
                     'target_grid_pos': grid_pos, 'is_valid': is_valid
                 }
 
-    def update(self):
+    def update(self) -> None:
         """Handles all per-frame state updates, like animations and fades."""
         if self.score_increment_alpha > 0:
             self.score_increment_alpha = max(0, self.score_increment_alpha - 4)
+            self._dirty = True
 
         if self.ui_state in ['ANIMATING_PICKUP', 'ANIMATING_DROP']:
             self._update_piece_animations()
+            self._dirty = True
 
 
-    def _update_piece_animations(self):
+    def _update_piece_animations(self) -> None:
         """Calculates and draws the current frame of any active piece animation."""
-        if not self.animation: return
+        animation = self.animation
+        if not animation: return
+        drag_info = self.drag_info
         
         now = pygame.time.get_ticks()
-        progress = min((now - self.animation['start_time']) / self.animation['duration'], 1.0)
+        progress = min((now - animation['start_time']) / animation['duration'], 1.0)
         eased_progress = math.sin(progress * math.pi / 2)
 
         if self.ui_state == 'ANIMATING_PICKUP':
-            current_scale = self.animation['start_scale'] + (1.0 - self.animation['start_scale']) * eased_progress
-            mouse_pos = pygame.mouse.get_pos()
-            print(pygame.mouse.get_pos())
-            scaled_offset = (self.drag_info['offset'][0] * (current_scale / self.tray_scale_factor),
-                             self.drag_info['offset'][1] * (current_scale / self.tray_scale_factor))
-            end_pos = (mouse_pos[0] - scaled_offset[0], mouse_pos[1] - scaled_offset[1])
-            start_pos = self.animation['start_pos']
+            start_scale = animation['start_scale']
+            current_scale = start_scale + (1.0 - start_scale) * eased_progress
+            mouse_x, mouse_y = pygame.mouse.get_pos()
+            offset_x, offset_y = drag_info['offset']
+            offset_scale = current_scale / self.tray_scale_factor
+            end_pos = (mouse_x - offset_x * offset_scale, mouse_y - offset_y * offset_scale)
+            start_pos = animation['start_pos']
             current_pos = (start_pos[0] + (end_pos[0] - start_pos[0]) * eased_progress,
                            start_pos[1] + (end_pos[1] - start_pos[1]) * eased_progress)
 
-            w, h = self.drag_info['surface'].get_size()
-            scaled_surface = pygame.transform.smoothscale(self.drag_info['surface'], (int(w * current_scale), int(h * current_scale)))
-            self.screen.blit(scaled_surface, current_pos)
+            frames = drag_info['scale_frames']
+            scaled_surface = frames[round(eased_progress * (len(frames) - 1))]
+            self._dirty_rects.append(self.screen.blit(scaled_surface, current_pos))
             
             if progress >= 1.0:
                 self.ui_state = 'DRAGGING'
                 self.animation = {}
 
         elif self.ui_state == 'ANIMATING_DROP':
-            start_pos = self.animation['start_pos']
-            end_pos = self.animation['end_pos'] if self.animation['is_valid'] else self.drag_info['tray_rect'].topleft
+            is_valid = animation['is_valid']
+            start_pos = animation['start_pos']
+            end_pos = animation['end_pos'] if is_valid else drag_info['tray_rect'].topleft
             current_pos = (start_pos[0] + (end_pos[0] - start_pos[0]) * eased_progress,
                            start_pos[1] + (end_pos[1] - start_pos[1]) * eased_progress)
 
-            current_scale = 1.0 - (1.0 - self.tray_scale_factor) * eased_progress if not self.animation['is_valid'] else 1.0
-            w, h = self.drag_info['surface'].get_size()
-            scaled_surface = pygame.transform.smoothscale(self.drag_info['surface'], (int(w * current_scale), int(h * current_scale)))
-            self.screen.blit(scaled_surface, current_pos)
+            # an invalid drop shrinks back to the tray scale, running the pickup frames backwards
+            if is_valid:
+                scaled_surface = drag_info['surface']
+            else:
+                frames = drag_info['scale_frames']
+                scaled_surface = frames[round((1.0 - eased_progress) * (len(frames) - 1))]
+            self._dirty_rects.append(self.screen.blit(scaled_surface, current_pos))
 
             if progress >= 1.0:
-                if self.animation['is_valid']:
-                    self.make_move(self.drag_info['name'], self.animation['target_grid_pos'])
+                if is_valid:
+                    self.make_move(drag_info['name'], animation['target_grid_pos'])
                 self.ui_state = 'IDLE'
                 self.animation = {}
                 self.drag_info = {}
 
-    def run(self):
+    def _render_game_over(self) -> tuple[pygame.Surface, pygame.Rect]:
+        """Renders the GAME OVER banner and the rect it is centred in over the board."""
+        text = self.game_over_font.render("GAME OVER", True, self.colors["game_over"])
+        text_rect = text.get_rect(center=(
+            (self.width * self.cell_size + 2 * self.margin) / 2, self.screen.get_height() / 2))
+        return text, text_rect
+
+    def run(self) -> typing.NoReturn:
         """Main game loop for manual play."""
         clock = pygame.time.Clock()
-        while True:
-            self.handle_input()
-            self.update()
-            
-            self.draw_board()
-            self.draw_hud()
-            self.draw_pieces_in_tray()
+        # loop invariants bound once, the loop body only touches locals
+        screen = self.screen
+        handle_input, update, present = self.handle_input, self.update, self._present
+        draw_board, draw_hud, draw_pieces_in_tray = self.draw_board, self.draw_hud, self.draw_pieces_in_tray
+        draw_ghost_piece, to_grid = self.draw_ghost_piece, self._to_grid
+        get_mouse_pos = pygame.mouse.get_pos
+        tray_scale_factor = self.tray_scale_factor
+        game_over_text, game_over_rect = self._render_game_over()
 
-            if self.ui_state == 'DRAGGING':
-                mouse_pos = pygame.mouse.get_pos()
-                scaled_offset = (self.drag_info['offset'][0] / self.tray_scale_factor, self.drag_info['offset'][1] / self.tray_scale_factor)
-                top_left = (mouse_pos[0] - scaled_offset[0], mouse_pos[1] - scaled_offset[1])
-                grid_pos = (round((top_left[0] - self.margin) / self.cell_size), round((top_left[1] - self.margin) / self.cell_size))
+        while True:
+            handle_input()
+            update()
 
-                self.draw_ghost_piece(self.drag_info['name'], grid_pos)
-                self.screen.blit(self.drag_info['surface'], top_left)
+            # nothing changed since the last flip; the ghost follows the mouse, so a held piece always redraws
+            ui_state = self.ui_state
+            if not self._dirty and ui_state == 'IDLE':
+                clock.tick(60)
+                continue
+            
+            draw_board()
+            draw_hud()
+            draw_pieces_in_tray()
+
+            if ui_state == 'DRAGGING':
+                drag_info = self.drag_info
+                mouse_x, mouse_y = get_mouse_pos()
+                offset_x, offset_y = drag_info['offset']
+                top_left = (mouse_x - offset_x / tray_scale_factor, mouse_y - offset_y / tray_scale_factor)
+
+                draw_ghost_piece(drag_info['name'], to_grid(top_left))
+                self._dirty_rects.append(screen.blit(drag_info['surface'], top_left))
             
-            if self.ui_state in ['ANIMATING_PICKUP', 'ANIMATING_DROP']:
+            if ui_state in ('ANIMATING_PICKUP', 'ANIMATING_DROP'):
                 self._update_piece_animations()
 
 
             if self.game_over:
-                text = self.game_over_font.render("GAME OVER", True, self.colors["game_over"])
-                text_rect = text.get_rect(center=(
-                    (self.width * self.cell_size + 2 * self.margin) / 2, self.screen.get_height() / 2))
-                self.screen.blit(text, text_rect)
+                self._dirty_rects.append(screen.blit(game_over_text, game_over_rect))
 
-            pygame.display.flip()
+            present()
+            self._dirty = False
             clock.tick(60)
 
-    def run_bot_play(self, bot):
+    def run_bot_play(self, bot: typing.Callable[[BlockBlastVisuallized], tuple[str, tuple[int, int]]]) -> typing.NoReturn:
         """
         Main game loop for bot-controlled play.
         - Press 'P' to play a single move from the bot.
-        - Press 'Q' to toggle autoplay, making the bot play continuously.
+        - Press 'Q' to toggle autoplay, making the bot play continuously, one move per _bot_interval_ms.
+        Frames are only redrawn when something changed.
         """
         clock = pygame.time.Clock()
         self.autoplay = False
+        # loop invariants bound once, the loop body only touches locals
+        screen = self.screen
+        make_move, update, present = self.make_move, self.update, self._present
+        draw_board, draw_hud, draw_pieces_in_tray = self.draw_board, self.draw_hud, self.draw_pieces_in_tray
+        get_events, get_ticks = pygame.event.get, pygame.time.get_ticks
+        game_over_text, game_over_rect = self._render_game_over()
 
         while True:
             # --- Event Handling for Bot Control ---
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in get_events():
+                self._dirty = True
+                event_type = event.type
+                if event_type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
+                if event_type == pygame.VIDEOEXPOSE:
+                    self._full_redraw = True
 
-                if event.type == pygame.KEYDOWN:
+                if event_type == pygame.KEYDOWN:
                     if event.key == pygame.K_q:
                         self.autoplay = not self.autoplay
                         print(f"Autoplay turned {'ON' if self.autoplay else 'OFF'}")
@@ -317,28 +484,34 @@ class BlockBlastVisuallized(BlockBlast):
                         if self.ui_state == 'IDLE' and not self.game_over:
                             piece, position = bot(self)
                             if piece and position is not None:
-                                self.make_move(piece, position)
+                                make_move(piece, position)
 
             # --- Autoplay Logic ---
-            if self.autoplay and self.ui_state == 'IDLE' and not self.game_over:
+            now = get_ticks()
+            if (self.autoplay and self.ui_state == 'IDLE' and not self.game_over
+                    and now - self._last_bot_time >= self._bot_interval_ms):
+                self._last_bot_time = now
                 piece, position = bot(self)
                 if piece and position is not None:
-                    self.make_move(piece, position)
+                    make_move(piece, position)
             
             # --- Standard Game Updates and Drawing ---
-            self.update()
+            update()
+
+            if not self._dirty:
+                clock.tick(60)
+                continue
             
-            self.draw_board()
-            self.draw_hud()
-            self.draw_pieces_in_tray()
+            draw_board()
+            draw_hud()
+            draw_pieces_in_tray()
 
             if self.game_over:
-                text = self.game_over_font.render("GAME OVER", True, self.colors["game_over"])
-                text_rect = text.get_rect(center=(
-                    (self.width * self.cell_size + 2 * self.margin) / 2, self.screen.get_height() / 2))
-                self.screen.blit(text, text_rect)
+                self._dirty_rects.append(screen.blit(game_over_text, game_over_rect))
 
-            pygame.display.flip()
+            present()
+            self._dirty = False
+            # caps rendering only, the bot keeps to its own interval
             clock.tick(60)
 
 